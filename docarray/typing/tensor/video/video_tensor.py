@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Type, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple, Type, TypeVar, Union
 
 import numpy as np
 
@@ -11,7 +11,7 @@ torch_available = is_torch_available()
 if torch_available:
     import torch
 
-    from docarray.typing.tensor.torch_tensor import TorchTensor  # noqa: F401
+    from docarray.typing.tensor.torch_tensor import TorchTensor
     from docarray.typing.tensor.video.video_torch_tensor import VideoTorchTensor
 
 
@@ -19,7 +19,7 @@ tf_available = is_tf_available()
 if tf_available:
     import tensorflow as tf  # type: ignore
 
-    from docarray.typing.tensor.tensorflow_tensor import TensorFlowTensor  # noqa: F401
+    from docarray.typing.tensor.tensorflow_tensor import TensorFlowTensor
     from docarray.typing.tensor.video.video_tensorflow_tensor import (
         VideoTensorFlowTensor,
     )
@@ -31,6 +31,54 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="VideoTensor")
 
 
+def _keep_tensor(value: Any, field: "ModelField", config: "BaseConfig") -> Any:
+    return value
+
+
+def _ndarray_to_video(
+    value: np.ndarray, field: "ModelField", config: "BaseConfig"
+) -> VideoNdArray:
+    if isinstance(value, VideoNdArray):
+        return value
+    return VideoNdArray.validate(value, field, config)
+
+
+# (type, converter) pairs tried in order by `VideoTensor.validate`, built once at
+# import time so that only the installed backends are checked
+_DISPATCH: List[Tuple[type, Callable[[Any, "ModelField", "BaseConfig"], Any]]] = []
+if torch_available:
+
+    def _torch_to_video(
+        value: torch.Tensor, field: "ModelField", config: "BaseConfig"
+    ) -> VideoTorchTensor:
+        return VideoTorchTensor._docarray_from_native(value)
+
+    _DISPATCH.append((TorchTensor, _keep_tensor))
+    _DISPATCH.append((torch.Tensor, _torch_to_video))
+if tf_available:
+
+    def _tf_to_video(
+        value: tf.Tensor, field: "ModelField", config: "BaseConfig"
+    ) -> VideoTensorFlowTensor:
+        return VideoTensorFlowTensor._docarray_from_native(value)
+
+    _DISPATCH.append((TensorFlowTensor, _keep_tensor))
+    _DISPATCH.append((tf.Tensor, _tf_to_video))
+_DISPATCH.append((np.ndarray, _ndarray_to_video))
+
+# already validated video tensors are returned unchanged
+_VIDEO_TENSOR_TYPES: Tuple[type, ...] = (VideoNdArray,)
+if torch_available:
+    _VIDEO_TENSOR_TYPES += (VideoTorchTensor,)
+if tf_available:
+    _VIDEO_TENSOR_TYPES += (VideoTensorFlowTensor,)
+
+_BAD_TYPE_MSG = (
+    "Expected one of [torch.Tensor, tensorflow.Tensor, numpy.ndarray] "
+    "compatible type, got %r"
+)
+
+
 class VideoTensor(AnyTensor, VideoTensorMixin):
     """
     Represents a Video tensor object that can be used with TensorFlow, PyTorch, and NumPy type.
@@ -84,24 +132,9 @@ class VideoTensor(AnyTensor, VideoTensorMixin):
         field: "ModelField",
         config: "BaseConfig",
     ):
-        if torch_available:
-            if isinstance(value, TorchTensor):
-                return cast(VideoTorchTensor, value)
-            elif isinstance(value, torch.Tensor):
-                return VideoTorchTensor._docarray_from_native(value)  # noqa
-        if tf_available:
-            if isinstance(value, TensorFlowTensor):
-                return cast(VideoTensorFlowTensor, value)
-            elif isinstance(value, tf.Tensor):
-                return VideoTensorFlowTensor._docarray_from_native(value)  # noqa
-        if isinstance(value, VideoNdArray):
-            return cast(VideoNdArray, value)
-        if isinstance(value, np.ndarray):
-            try:
-                return VideoNdArray.validate(value, field, config)
-            except Exception as e:  # noqa
-                raise e
-        raise TypeError(
-            f"Expected one of [torch.Tensor, tensorflow.Tensor, numpy.ndarray] "
-            f"compatible type, got {type(value)}"
-        )
+        if type(value) in _VIDEO_TENSOR_TYPES:
+            return value
+        for typ, convert in _DISPATCH:
+            if isinstance(value, typ):
+                return convert(value, field, config)
+        raise TypeError(_BAD_TYPE_MSG % (type(value),))
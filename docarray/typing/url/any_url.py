@@ -1,13 +1,26 @@
 import mimetypes
 import os
+import re
 import urllib
 import urllib.parse
 import urllib.request
-from typing import TYPE_CHECKING, Any, List, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 from pydantic import AnyUrl as BaseAnyUrl
-from pydantic import errors, parse_obj_as
+from pydantic import BaseModel, ValidationError, create_model, errors, parse_obj_as
+from pydantic.error_wrappers import ErrorWrapper
 
 from docarray.typing.abstract_type import AbstractType
 from docarray.typing.proto_register import _register_proto
@@ -23,6 +36,60 @@ T = TypeVar('T', bound='AnyUrl')
 
 mimetypes.init([])
 
+_HTTP_PREFIXES = ('http://', 'https://')
+_REMOTE_SCHEME_RE = re.compile(r'^(?:https?|data):', re.IGNORECASE)
+_DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime_for_extension(extension: str) -> Optional[str]:
+    """
+    Cached `mimetypes.guess_type` lookup keyed on a file extension.
+    Types re-registered with `mimetypes.add_type` for an extension after its first
+    lookup are not seen.
+    """
+    return mimetypes.guess_type(f'file{extension}')[0]
+
+
+def _guess_mime(path: str) -> Optional[str]:
+    """Guess the mime type of a path like `mimetypes.guess_type` does."""
+    extension = os.path.splitext(path)[1]
+    # for a plain extension known to `mimetypes`, `guess_type` only depends on the
+    # extension itself. Data urls, unknown extensions and suffixes that `mimetypes`
+    # resolves together with the previous one (e.g. `.tar.gz` or `.tgz`) need the
+    # full path.
+    lowered = extension.lower()
+    if (
+        lowered in mimetypes.types_map
+        and lowered not in mimetypes.suffix_map
+        and lowered not in mimetypes.encodings_map
+        and not path[:5].lower() == 'data:'
+    ):
+        return _guess_mime_for_extension(extension)
+    return mimetypes.guess_type(path)[0]
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(
+    cls: Type[T], value: str, field: 'ModelField', config: 'BaseConfig'
+) -> T:
+    """
+    Cached version of `AnyUrl._validate_url` for string inputs.
+
+    The field and config are part of the key because they are passed on to
+    pydantic's checks, e.g. the length limits are read from the field. Note that:
+    - documents validated with the same url share a single url instance, which
+        is fine as urls are immutable strings
+    - up to `maxsize` entries keep their class, field and config alive, including
+        those of dynamically created document classes
+    - the cache only pays off for repeated urls, validating unique urls is
+        slightly slower than without it
+    - relative paths are length checked as absolute paths, which depend on the
+        current working directory, but the working directory is not part of the
+        key
+    """
+    return cls._validate_url(value, field, config)
+
 
 @_register_proto(proto_type_name='any_url')
 class AnyUrl(BaseAnyUrl, AbstractType):
@@ -41,6 +108,12 @@ class AnyUrl(BaseAnyUrl, AbstractType):
         that are not covered by the mimetypes library."""
         raise NotImplementedError
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _allowed_extra_extensions(cls) -> FrozenSet[str]:
+        """Returns the extra file extensions of the class as a cached frozenset."""
+        return frozenset(cls.extra_extensions())
+
     def _to_node_protobuf(self) -> 'NodeProto':
         """Convert Document into a NodeProto protobuf message. This function should
         be called when the Document is nested into another Document that need to
@@ -50,7 +123,7 @@ class AnyUrl(BaseAnyUrl, AbstractType):
         """
         from docarray.proto import NodeProto
 
-        return NodeProto(text=str(self), type=self._proto_type_name)
+        return NodeProto(text=self, type=self._proto_type_name)
 
     @staticmethod
     def _get_url_extension(url: str) -> str:
@@ -65,16 +138,15 @@ class AnyUrl(BaseAnyUrl, AbstractType):
         """
 
         parsed_url = urllib.parse.urlparse(url)
-        ext = os.path.splitext(parsed_url.path)[1]
-        ext = ext[1:] if ext.startswith('.') else ext
-        return ext
+        # splitext returns either '' or the extension including its leading period
+        return os.path.splitext(parsed_url.path)[1][1:]
 
     @classmethod
     def is_extension_allowed(cls, value: Any) -> bool:
         """
         Check if the file extension of the URL is allowed for this class.
-        First, it guesses the mime type of the file. If it fails to detect the
-        mime type, it then checks the extra file extensions.
+        First, it checks the extra file extensions. If the extension is not one of
+        them, it guesses the mime type of the file.
         Note: This method assumes that any URL without an extension is valid.
 
         :param value: The URL or file path.
@@ -83,16 +155,16 @@ class AnyUrl(BaseAnyUrl, AbstractType):
         if cls is AnyUrl:
             return True
 
-        url_parts = value.split('?')
         extension = cls._get_url_extension(value)
         if not extension:
             return True
 
-        mimetype, _ = mimetypes.guess_type(url_parts[0])
-        if mimetype and mimetype.startswith(cls.mime_type()):
+        # a set lookup is cheaper than guessing the mime type, so check it first
+        if extension in cls._allowed_extra_extensions():
             return True
 
-        return extension in cls.extra_extensions()
+        mimetype = _guess_mime(value.partition('?')[0])
+        return mimetype is not None and mimetype.startswith(cls.mime_type())
 
     @classmethod
     def validate(
@@ -101,19 +173,74 @@ class AnyUrl(BaseAnyUrl, AbstractType):
         field: 'ModelField',
         config: 'BaseConfig',
     ) -> T:
-        import os
+        if isinstance(value, str):
+            # the result only depends on the class, the string, the field and
+            # the config, so repeated urls can be served from the cache
+            return _validate_cached(cls, value, field, config)
+        return cls._validate_url(value, field, config)
+
+    @classmethod
+    def validate_many(cls: Type[T], values: Sequence[Any]) -> List[T]:
+        """
+        Validate a batch of urls outside of a pydantic model.
 
+        Unlike `parse_obj_as(List[cls], values)`, values are passed straight to
+        `validate` with a single field and config, skipping pydantic's per-item
+        field machinery, so repeated urls cost a single cache lookup. Like
+        `parse_obj_as`, invalid values raise a `pydantic.ValidationError`, with the
+        index of each failing value as its location.
+
+        ---
+
+        ```python
+        from docarray.typing import ImageUrl
+
+        urls = ImageUrl.validate_many(['a.png', 'b.jpg', 'a.png'])
+        assert urls == ['a.png', 'b.jpg', 'a.png']
+        ```
+
+        ---
+
+        :param values: the urls or file paths to validate.
+        :return: the list of validated urls, in the same order as `values`.
+        """
+        model = cls._validation_model()
+        field = model.__fields__['url']
+        config = model.__config__
+        validate = cls.validate
+        urls: List[T] = []
+        errors_: List[ErrorWrapper] = []
+        for i, value in enumerate(values):
+            # call the validator directly instead of going through
+            # `field.validate`, so that known urls are a single cache lookup
+            try:
+                urls.append(validate(value, field, config))
+            except (ValueError, TypeError, AssertionError) as e:
+                errors_.append(ErrorWrapper(e, loc=(i,)))
+        if errors_:
+            raise ValidationError(errors_, model)
+        return urls
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _validation_model(cls) -> Type[BaseModel]:
+        """Returns a pydantic model with a single field of this class."""
+        return create_model(cls.__name__, url=(cls, ...))
+
+    @classmethod
+    def _validate_url(
+        cls: Type[T],
+        value: Union[T, np.ndarray, Any],
+        field: 'ModelField',
+        config: 'BaseConfig',
+    ) -> T:
         abs_path: Union[T, np.ndarray, Any]
-        if (
+        input_is_relative_path = (
             isinstance(value, str)
-            and not value.startswith('http')
+            and not value.startswith(_HTTP_PREFIXES)
             and not os.path.isabs(value)
-        ):
-            input_is_relative_path = True
-            abs_path = os.path.abspath(value)
-        else:
-            input_is_relative_path = False
-            abs_path = value
+        )
+        abs_path = os.path.abspath(value) if input_is_relative_path else value
 
         url = super().validate(abs_path, field, config)  # basic url validation
 
@@ -203,13 +330,18 @@ class AnyUrl(BaseAnyUrl, AbstractType):
         :param timeout: timeout for urlopen. Only relevant if URI is not local
         :return: bytes.
         """
-        if urllib.parse.urlparse(self).scheme in {'http', 'https', 'data'}:
-            req = urllib.request.Request(self, headers={'User-Agent': 'Mozilla/5.0'})
+        if _REMOTE_SCHEME_RE.match(self):
+            req = urllib.request.Request(self, headers=_DEFAULT_HEADERS)
             urlopen_kwargs = {'timeout': timeout} if timeout is not None else {}
             with urllib.request.urlopen(req, **urlopen_kwargs) as fp:  # type: ignore
                 return fp.read()
-        elif os.path.exists(self):
-            with open(self, 'rb') as fp:
-                return fp.read()
-        else:
-            raise FileNotFoundError(f'`{self}` is not a URL or a valid local path')
+        try:
+            # open directly instead of checking os.path.exists first, which would
+            # stat the file a second time
+            fp = open(self, 'rb')
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            raise FileNotFoundError(
+                f'`{self}` is not a URL or a valid local path'
+            ) from None
+        with fp:
+            return fp.read()
@@ -1,8 +1,13 @@
+import os
+import urllib.request
+
 import pytest
+from pydantic import ValidationError
 from pydantic.tools import parse_obj_as, schema_json_of
 
+from docarray import BaseDoc
 from docarray.base_doc.io.json import orjson_dumps
-from docarray.typing import AnyUrl
+from docarray.typing import AnyUrl, ImageUrl, TextUrl
 
 
 @pytest.mark.proto
@@ -57,3 +62,119 @@ def test_get_url_extension():
 
     # Test with empty input
     assert not AnyUrl._get_url_extension('')
+
+
+def test_validate_does_not_open_remote_url(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError('validation must not perform network I/O')
+
+    monkeypatch.setattr(urllib.request, 'urlopen', _fail)
+
+    url = parse_obj_as(TextUrl, 'https://jina.ai/some/page?model=gpt-4')
+    assert url == 'https://jina.ai/some/page?model=gpt-4'
+
+
+def test_validate_cache_hit():
+    from docarray.typing.url.any_url import _validate_cached
+
+    class MyDoc(BaseDoc):
+        url: TextUrl
+
+    docs = [MyDoc(url='https://jina.ai/text.txt') for _ in range(3)]
+    hits = _validate_cached.cache_info().hits
+    doc = MyDoc(url='https://jina.ai/text.txt')
+
+    assert _validate_cached.cache_info().hits == hits + 1
+    assert all(d.url == doc.url for d in docs)
+    assert isinstance(doc.url, TextUrl)
+
+
+def test_validate_many():
+    values = ['data/05978.txt', 'https://jina.ai/text.txt', 'data/05978.txt']
+    urls = TextUrl.validate_many(values)
+
+    assert urls == [parse_obj_as(TextUrl, value) for value in values]
+    assert all(isinstance(url, TextUrl) for url in urls)
+
+    with pytest.raises(ValidationError) as exc_info:
+        TextUrl.validate_many(['https://jina.ai/text.txt', 'data/05978.jpg', None])
+    assert [error['loc'] for error in exc_info.value.errors()] == [(1,), (2,)]
+
+
+def test_mime_cache_keyed_on_extension():
+    from docarray.typing.url.any_url import _guess_mime_for_extension
+
+    TextUrl.validate_many(['https://jina.ai/p/0.txt'])
+    hits = _guess_mime_for_extension.cache_info().hits
+    TextUrl.validate_many([f'https://jina.ai/p/{i}.txt' for i in range(1, 11)])
+
+    assert _guess_mime_for_extension.cache_info().hits == hits + 10
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        'does/not/exist.txt',
+        os.path.join(os.path.abspath(__file__), 'not_a_dir.txt'),
+        'null\x00byte.txt',
+    ],
+)
+def test_load_bytes_missing_file(path):
+    url = parse_obj_as(AnyUrl, path)
+
+    with pytest.raises(FileNotFoundError, match='not a URL or a valid local path') as e:
+        url.load_bytes()
+    assert e.value.__suppress_context__
+
+
+def test_validate_cache_keyed_on_field_and_config():
+    from docarray.typing.url.any_url import _validate_cached
+
+    class ShortTextUrl(TextUrl):
+        max_length = 10
+
+    class MyDoc(BaseDoc):
+        url: TextUrl
+
+    class MyShortDoc(BaseDoc):
+        url: ShortTextUrl
+
+    class MyOtherDoc(BaseDoc):
+        url: TextUrl
+
+        class Config:
+            max_anystr_length = 10
+
+    url = 'https://jina.ai/some/long/path.txt'
+    TextUrl.validate(url, MyDoc.__fields__['url'], MyDoc.__config__)
+
+    # pydantic reads the length limits from the field, so a cached entry of
+    # another field must not be reused
+    with pytest.raises(ValueError):
+        TextUrl.validate(url, MyShortDoc.__fields__['url'], MyDoc.__config__)
+
+    misses = _validate_cached.cache_info().misses
+    TextUrl.validate(url, MyDoc.__fields__['url'], MyOtherDoc.__config__)
+    assert _validate_cached.cache_info().misses == misses + 1
+
+
+@pytest.mark.parametrize(
+    'url_cls, url, allowed',
+    [
+        (ImageUrl, 'img.png#x', False),
+        (ImageUrl, 'https://jina.ai/a.png;p=1', False),
+        (ImageUrl, 'a.txt#b.png', True),
+        (TextUrl, 'a.txt#b.png', False),
+        (ImageUrl, 'img.PNG', True),
+        (ImageUrl, 'archive.tar.gz', False),
+    ],
+)
+def test_mime_type_guessed_from_path_without_query(url_cls, url, allowed):
+    # the mime type is guessed from the url up to the first '?', including any
+    # fragment or parameters
+    assert url_cls.is_extension_allowed(url) == allowed
+
+
+def test_load_bytes_data_url():
+    url = parse_obj_as(AnyUrl, 'data:text/plain;base64,aGVsbG8=')
+    assert url.load_bytes() == b'hello'